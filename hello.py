@@ -1,6 +0,0 @@
-def main():
-    print("Hello from tzconverter!")
-
-
-if __name__ == "__main__":
-    main()
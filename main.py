@@ -1,20 +1,108 @@
 import air
+from fastapi import Query, Response
+from fastapi.responses import HTMLResponse
+from fastapi.staticfiles import StaticFiles
 from tzconverter.timezones import (
     get_common_timezones,
-    get_current_time_in_timezone,
+    COMMON_TIMEZONES_MAP,
     format_timezone_display,
-    generate_24hour_slots,
-    calculate_viability_score
+    generate_24hour_indices,
+    calculate_viability_scores_batch,
+    cached_offset_hours,
+    _zi
 )
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
 from zoneinfo import ZoneInfo
-from typing import Dict, List
-import uuid
+from typing import Dict, Optional
+import itertools
+import sys
+import time
 
-app = air.Air()
 
-# In-memory session storage (will be replaced by localStorage later)
-sessions: Dict[str, List[Dict]] = {}
+class _ImmutableStaticFiles(StaticFiles):
+    """Static files served with a far-future immutable cache header."""
+
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
+
+@dataclass(slots=True)
+class TzEntry:
+    """A timezone selected in a session."""
+    id: str
+    name: str
+    preferred_start: int
+    preferred_end: int
+    uid: str
+
+
+@dataclass(slots=True)
+class _Session:
+    """Per-session state: selected timezones plus their uid counter."""
+    entries: Dict[str, TzEntry] = field(default_factory=dict)
+    # uids only target htmx swaps, so a short monotonic id beats a UUID
+    # (which costs an os.urandom syscall per add); living inside the
+    # session, the counter is evicted along with it
+    uid_counter: itertools.count = field(default_factory=lambda: itertools.count(1))
+
+
+class _TTLSessions:
+    """
+    Bounded in-memory session store with TTL eviction.
+
+    Sessions expire after `ttl` seconds without access; once `maxsize`
+    live sessions exist, the least recently used one is dropped. Keeps
+    the store from growing unboundedly when per-user session IDs land.
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # session_id -> (expiry, session); dict order doubles as LRU order
+        self._data: Dict[str, tuple] = {}
+
+    def _touch(self, session_id: str, session: _Session):
+        """Refresh a session's expiry and move it to most-recently-used."""
+        self._data.pop(session_id, None)
+        self._data[session_id] = (time.monotonic() + self.ttl, session)
+
+    def get(self, session_id: str) -> Optional[_Session]:
+        """Get a session, or None if absent or expired."""
+        item = self._data.get(session_id)
+        if item is None:
+            return None
+        expiry, session = item
+        if expiry <= time.monotonic():
+            del self._data[session_id]
+            return None
+        self._touch(session_id, session)
+        return session
+
+    def setdefault(self, session_id: str) -> _Session:
+        """Get a session, creating it if needed."""
+        session = self.get(session_id)
+        if session is None:
+            session = _Session()
+            self._touch(session_id, session)
+            self._evict()
+        return session
+
+    def _evict(self):
+        """Drop expired sessions, then least-recently-used over maxsize."""
+        now = time.monotonic()
+        for sid in [s for s, (expiry, _) in self._data.items() if expiry <= now]:
+            del self._data[sid]
+        while len(self._data) > self.maxsize:
+            del self._data[next(iter(self._data))]
+
+
+# In-memory session storage, keyed session_id -> uid -> timezone entry
+# (will be replaced by localStorage later)
+sessions = _TTLSessions()
 
 
 def get_session_id():
@@ -23,219 +111,74 @@ def get_session_id():
 
 
 def get_session_timezones():
-    """Get timezones for current session."""
-    session_id = get_session_id()
-    return sessions.get(session_id, [])
+    """Get timezones for current session (in insertion order)."""
+    session = sessions.get(get_session_id())
+    return list(session.entries.values()) if session else []
 
 
 def add_timezone_to_session(tz_id: str, tz_name: str):
-    """Add timezone to session."""
-    session_id = get_session_id()
-    if session_id not in sessions:
-        sessions[session_id] = []
-    
+    """Add timezone to session, returning the new entry (None if duplicate)."""
+    session = sessions.setdefault(get_session_id())
+    entries = session.entries
+
+    # Intern the tz_id: there are <=49 distinct values, so duplicate
+    # checks and dict keys share one string object
+    tz_id = sys.intern(tz_id)
+
     # Check if already exists
-    for tz in sessions[session_id]:
-        if tz["id"] == tz_id:
-            return
-    
-    sessions[session_id].append({
-        "id": tz_id,
-        "name": tz_name,
-        "preferred_start": 9,
-        "preferred_end": 17,
-        "uid": str(uuid.uuid4())
-    })
+    if any(tz.id == tz_id for tz in entries.values()):
+        return None
+
+    uid = str(next(session.uid_counter))
+    entry = entries[uid] = TzEntry(
+        id=tz_id,
+        name=tz_name,
+        preferred_start=9,
+        preferred_end=17,
+        uid=uid
+    )
+    return entry
 
 
 def remove_timezone_from_session(uid: str):
     """Remove timezone from session by UID."""
-    session_id = get_session_id()
-    if session_id in sessions:
-        sessions[session_id] = [tz for tz in sessions[session_id] if tz["uid"] != uid]
+    session = sessions.get(get_session_id())
+    if session is not None:
+        session.entries.pop(uid, None)
 
 
 def update_timezone_hours(uid: str, start: int, end: int):
     """Update preferred hours for a timezone."""
-    session_id = get_session_id()
-    if session_id in sessions:
-        for tz in sessions[session_id]:
-            if tz["uid"] == uid:
-                tz["preferred_start"] = start
-                tz["preferred_end"] = end
-                break
+    session = sessions.get(get_session_id())
+    tz = session.entries.get(uid) if session else None
+    if tz is not None:
+        tz.preferred_start = start
+        tz.preferred_end = end
 
 
-@app.get("/")
-async def index():
+# Selector options and the page head are static, so build them once at
+# import instead of on every page load
+_TZ_OPTIONS = tuple(
+    air.Option(name, value=tz_id) for tz_id, name in get_common_timezones()
+)
+
+_PAGE_HEAD = air.Raw(
+    air.Head(
+        air.Meta(charset="utf-8"),
+        air.Meta(name="viewport", content="width=device-width, initial-scale=1"),
+        air.Title("Timezone Meeting Scheduler"),
+        air.Link(rel="stylesheet", href="https://cdn.jsdelivr.net/npm/@picocss/pico@2/css/pico.min.css"),
+        air.Script(src="https://unpkg.com/htmx.org@1.9.10"),
+        air.Link(rel="stylesheet", href="/static/app.css"),
+        air.Script(src="/static/app.js"),
+    ).render()
+)
+
+
+def _build_index():
+    """Build the index page component tree (rendered once at import)."""
     return air.Html(
-        air.Head(
-            air.Meta(charset="utf-8"),
-            air.Meta(name="viewport", content="width=device-width, initial-scale=1"),
-            air.Title("Timezone Meeting Scheduler"),
-            air.Link(rel="stylesheet", href="https://cdn.jsdelivr.net/npm/@picocss/pico@2/css/pico.min.css"),
-            air.Script(src="https://unpkg.com/htmx.org@1.9.10"),
-            air.Script("""
-                // Auto-refresh view when timezones change
-                document.addEventListener('DOMContentLoaded', function() {
-                    let currentView = null;
-                    
-                    // Track which view is active
-                    document.addEventListener('htmx:afterRequest', function(evt) {
-                        if (evt.detail.pathInfo.requestPath === '/grid') {
-                            currentView = 'grid';
-                        } else if (evt.detail.pathInfo.requestPath === '/converter') {
-                            currentView = 'converter';
-                        }
-                        
-                        // Refresh view after timezone changes
-                        const refreshPaths = ['/add-timezone', '/remove-timezone', '/update-hours'];
-                        if (refreshPaths.some(path => evt.detail.pathInfo.requestPath.includes(path))) {
-                            if (currentView === 'grid') {
-                                htmx.ajax('GET', '/grid', {target: '#view-content', swap: 'innerHTML'});
-                            } else if (currentView === 'converter') {
-                                htmx.ajax('GET', '/converter', {target: '#view-content', swap: 'innerHTML'});
-                            }
-                        }
-                    });
-                });
-            """),
-            air.Style("""
-                .timezone-card {
-                    margin-bottom: 1rem;
-                    padding: 1rem;
-                    border: 1px solid var(--pico-muted-border-color);
-                    border-radius: var(--pico-border-radius);
-                }
-                .timezone-header {
-                    display: flex;
-                    justify-content: space-between;
-                    align-items: center;
-                    margin-bottom: 0.5rem;
-                }
-                .timezone-controls {
-                    display: grid;
-                    grid-template-columns: 1fr 1fr;
-                    gap: 1rem;
-                    margin-top: 0.5rem;
-                }
-                .view-toggle {
-                    display: flex;
-                    gap: 0.5rem;
-                    margin: 1.5rem 0;
-                }
-                .view-content {
-                    min-height: 200px;
-                }
-                #timezone-list:empty::before {
-                    content: "No timezones selected. Add some above to get started!";
-                    display: block;
-                    padding: 2rem;
-                    text-align: center;
-                    color: var(--pico-muted-color);
-                    font-style: italic;
-                }
-                
-                /* Grid View Styles */
-                .grid-container {
-                    overflow-x: auto;
-                    margin: 1rem 0;
-                }
-                .time-grid {
-                    display: flex;
-                    gap: 0.25rem;
-                    min-width: max-content;
-                    padding: 1rem 0;
-                }
-                .time-slot {
-                    flex: 0 0 80px;
-                    text-align: center;
-                    cursor: pointer;
-                    transition: transform 0.2s;
-                    border-radius: var(--pico-border-radius);
-                    padding: 1rem 0.5rem;
-                    border: 2px solid transparent;
-                }
-                .time-slot:hover {
-                    transform: translateY(-2px);
-                    border-color: var(--pico-primary);
-                }
-                .time-slot.green {
-                    background-color: #d4edda;
-                    color: #155724;
-                }
-                .time-slot.yellow {
-                    background-color: #fff3cd;
-                    color: #856404;
-                }
-                .time-slot.red {
-                    background-color: #f8d7da;
-                    color: #721c24;
-                }
-                .time-slot-time {
-                    font-weight: bold;
-                    font-size: 1.1rem;
-                    margin-bottom: 0.25rem;
-                }
-                .time-slot-score {
-                    font-size: 0.85rem;
-                }
-                .grid-legend {
-                    display: flex;
-                    gap: 1rem;
-                    justify-content: center;
-                    margin-bottom: 1rem;
-                    flex-wrap: wrap;
-                }
-                .legend-item {
-                    display: flex;
-                    align-items: center;
-                    gap: 0.5rem;
-                }
-                .legend-color {
-                    width: 20px;
-                    height: 20px;
-                    border-radius: 4px;
-                }
-                .legend-color.green {
-                    background-color: #d4edda;
-                }
-                .legend-color.yellow {
-                    background-color: #fff3cd;
-                }
-                .legend-color.red {
-                    background-color: #f8d7da;
-                }
-                
-                /* Time Detail Modal */
-                .time-detail {
-                    margin-top: 1rem;
-                    padding: 1rem;
-                    border: 1px solid var(--pico-muted-border-color);
-                    border-radius: var(--pico-border-radius);
-                    background: var(--pico-background-color);
-                }
-                .time-detail-header {
-                    display: flex;
-                    justify-content: space-between;
-                    align-items: center;
-                    margin-bottom: 1rem;
-                }
-                .timezone-time-row {
-                    display: flex;
-                    justify-content: space-between;
-                    padding: 0.5rem;
-                    margin: 0.25rem 0;
-                    border-radius: var(--pico-border-radius);
-                }
-                .timezone-time-row.in-hours {
-                    background-color: #d4edda;
-                }
-                .timezone-time-row.out-hours {
-                    background-color: #f8d7da;
-                }
-            """)
-        ),
+        _PAGE_HEAD,
         air.Body(
             air.Main(
                 {"class": "container"},
@@ -246,13 +189,13 @@ async def index():
                 air.Article(
                     air.H2("Add Timezone"),
                     air.Form(
-                        {"hx-post": "/add-timezone", "hx-target": "#timezone-list", "hx-swap": "innerHTML"},
+                        {"hx-post": "/add-timezone", "hx-swap": "none"},
                         air.Div(
                             {"style": "display: grid; grid-template-columns: 1fr auto; gap: 1rem;"},
                             air.Select(
                                 {"name": "timezone", "required": True},
                                 air.Option("Select a timezone...", value=""),
-                                *[air.Option(name, value=tz_id) for tz_id, name in get_common_timezones()]
+                                *_TZ_OPTIONS
                             ),
                             air.Button("Add Timezone", type="submit")
                         )
@@ -276,10 +219,15 @@ async def index():
                     })
                 ),
                 
-                # Selected Timezones
+                # Selected Timezones (fetched on load so a reload still
+                # shows the session's existing cards)
                 air.Article(
                     air.H2("Selected Timezones"),
-                    air.Div({"id": "timezone-list"})
+                    air.Div({
+                        "id": "timezone-list",
+                        "hx-get": "/timezone-list",
+                        "hx-trigger": "load"
+                    })
                 ),
                 
                 # View Content Area
@@ -295,119 +243,176 @@ async def index():
     )
 
 
-@app.post("/add-timezone")
-async def add_timezone(timezone: str = None):
-    """Add a timezone to the session."""
-    if not timezone:
-        return render_timezone_list()
-    
-    # Find the display name
-    tz_name = None
-    for tz_id, name in get_common_timezones():
-        if tz_id == timezone:
-            tz_name = name
-            break
-    
-    if tz_name:
-        add_timezone_to_session(timezone, tz_name)
-    
+# The index page is identical for every user (session state arrives via
+# htmx fragments), so render it once and serve the cached string
+_INDEX_HTML = _build_index().render()
+
+# Handlers stay `async def` even though they do no I/O: FastAPI dispatches
+# plain `def` handlers to a threadpool, and for these sub-millisecond
+# CPU-only bodies the thread hop costs more than the coroutine.
+
+
+async def index():
+    return HTMLResponse(_INDEX_HTML)
+
+
+async def timezone_list():
+    """Serve the session's timezone cards; loaded into the cached index page."""
     return render_timezone_list()
 
 
-@app.delete("/remove-timezone/{uid}")
+async def add_timezone(timezone: str = None):
+    """Add a timezone to the session, returning just the new card."""
+    tz_name = COMMON_TIMEZONES_MAP.get(timezone) if timezone else None
+    entry = add_timezone_to_session(timezone, tz_name) if tz_name else None
+
+    if entry is None:
+        # Unknown timezone or already present: nothing to swap in
+        return Response(status_code=204)
+
+    # Only the new card goes over the wire; htmx appends it out-of-band
+    return render_timezone_card(entry, oob=True)
+
+
 async def remove_timezone(uid: str):
-    """Remove a timezone from the session."""
+    """Remove a timezone from the session; the card deletes client-side."""
     remove_timezone_from_session(uid)
-    return render_timezone_list()
+    return Response(status_code=200)
 
 
-@app.post("/update-hours/{uid}")
-async def update_hours(uid: str, start: int = 9, end: int = 17):
-    """Update preferred hours for a timezone."""
+async def update_hours(
+    uid: str,
+    start: int = Query(9, ge=0, le=23),
+    end: int = Query(17, ge=0, le=23),
+):
+    """Update preferred hours, refreshing the card's hour labels out-of-band."""
+    # Bounds are enforced before anything persists: out-of-range hours
+    # would poison the session and crash the label tables and bit masks
     update_timezone_hours(uid, start, end)
-    return render_timezone_list()
+    # The inputs swap nothing in place (hx-swap="none"), so send the two
+    # hour labels as out-of-band replacements to keep the card current
+    return air.Raw(
+        _hour_label("start", uid, start, oob=True).render()
+        + _hour_label("end", uid, end, oob=True).render()
+    )
 
 
-def render_timezone_list():
-    """Render the list of timezone cards."""
-    timezones = get_session_timezones()
-    
-    if not timezones:
-        return air.Div()
-    
-    cards = []
-    for tz in timezones:
-        current_time = get_current_time_in_timezone(tz["id"])
-        time_str = current_time.strftime("%I:%M %p")
-        date_str = current_time.strftime("%A, %B %d, %Y")
-        
-        cards.append(
+# Card timestamp formats, parsed once by strftime implementations that cache
+_CARD_TIME_FMT = "%I:%M %p"
+_CARD_DATE_FMT = "%A, %B %d, %Y"
+
+# 12-hour clock labels indexed by 24-hour value, e.g. "12AM" / "12:00 AM" /
+# "12 AM" — one tuple index instead of arithmetic plus a branch per use
+_HOUR12_LABEL = tuple(f"{(h % 12) or 12}{'AM' if h < 12 else 'PM'}" for h in range(24))
+_HOUR12_COLON = tuple(f"{(h % 12) or 12}:00 {'AM' if h < 12 else 'PM'}" for h in range(24))
+_HOUR12_AMPM = tuple(f"{(h % 12) or 12} {'AM' if h < 12 else 'PM'}" for h in range(24))
+
+
+def _hour_label(kind: str, uid: str, hour: int, oob: bool = False):
+    """Render a preferred-hour label, optionally as an out-of-band swap."""
+    attrs = {"id": f"{kind}-label-{uid}"}
+    if oob:
+        attrs["hx-swap-oob"] = "true"
+    return air.Small(f"{hour}:00 ({_HOUR12_AMPM[hour]})", **attrs)
+
+
+def render_timezone_card(tz, oob: bool = False, now_utc: datetime = None):
+    """Render a single timezone card, optionally as an out-of-band append."""
+    if now_utc is None:
+        now_utc = datetime.now(_zi("UTC"))
+    # Convert the shared UTC reading rather than taking a fresh clock
+    # reading per card; astimezone resolves the offset at the actual
+    # instant (cards show minutes, so whole-hour shortcuts don't apply)
+    current_time = now_utc.astimezone(_zi(tz.id))
+    time_str = current_time.strftime(_CARD_TIME_FMT)
+    date_str = current_time.strftime(_CARD_DATE_FMT)
+
+    # Attrs go as kwargs: under air 0.35 a dict child renders as escaped
+    # text, and the card's id / hx-swap-oob must land as real attributes
+    # for the OOB append and the Remove button's target to work
+    card_attrs = {"class": "timezone-card", "id": f"tz-card-{tz.uid}"}
+    if oob:
+        card_attrs["hx-swap-oob"] = "beforeend:#timezone-list"
+
+    return air.Div(
+        air.Div(
+            {"class": "timezone-header"},
             air.Div(
-                {"class": "timezone-card"},
-                air.Div(
-                    {"class": "timezone-header"},
-                    air.Div(
-                        air.Strong(tz["name"]),
-                        air.Br(),
-                        air.Small(f"{time_str} • {date_str}")
-                    ),
-                    air.Button(
-                        "Remove",
-                        **{
-                            "hx-delete": f"/remove-timezone/{tz['uid']}",
-                            "hx-target": "#timezone-list",
-                            "hx-swap": "innerHTML",
-                            "class": "secondary outline",
-                            "style": "margin: 0;"
-                        }
-                    )
+                air.Strong(tz.name),
+                air.Br(),
+                air.Small(f"{time_str} • {date_str}")
+            ),
+            air.Button(
+                "Remove",
+                **{
+                    "hx-delete": f"/remove-timezone/{tz.uid}",
+                    "hx-target": f"#tz-card-{tz.uid}",
+                    "hx-swap": "delete",
+                    "class": "secondary outline",
+                    "style": "margin: 0;"
+                }
+            )
+        ),
+        air.Div(
+            {"class": "timezone-controls"},
+            air.Label(
+                "Preferred Start Time",
+                air.Input(
+                    type="number",
+                    name="start",
+                    min="0",
+                    max="23",
+                    value=str(tz.preferred_start),
+                    **{
+                        "hx-post": f"/update-hours/{tz.uid}",
+                        "hx-trigger": "change",
+                        "hx-swap": "none",
+                        "hx-include": "[name='end']"
+                    }
                 ),
-                air.Div(
-                    {"class": "timezone-controls"},
-                    air.Label(
-                        "Preferred Start Time",
-                        air.Input(
-                            type="number",
-                            name="start",
-                            min="0",
-                            max="23",
-                            value=str(tz["preferred_start"]),
-                            **{
-                                "hx-post": f"/update-hours/{tz['uid']}",
-                                "hx-trigger": "change",
-                                "hx-target": "#timezone-list",
-                                "hx-swap": "innerHTML",
-                                "hx-include": "[name='end']"
-                            }
-                        ),
-                        air.Small(f"{tz['preferred_start']}:00 ({tz['preferred_start'] % 12 or 12}{' AM' if tz['preferred_start'] < 12 else ' PM'})")
-                    ),
-                    air.Label(
-                        "Preferred End Time",
-                        air.Input(
-                            type="number",
-                            name="end",
-                            min="0",
-                            max="23",
-                            value=str(tz["preferred_end"]),
-                            **{
-                                "hx-post": f"/update-hours/{tz['uid']}",
-                                "hx-trigger": "change",
-                                "hx-target": "#timezone-list",
-                                "hx-swap": "innerHTML",
-                                "hx-include": "[name='start']"
-                            }
-                        ),
-                        air.Small(f"{tz['preferred_end']}:00 ({tz['preferred_end'] % 12 or 12}{' AM' if tz['preferred_end'] < 12 else ' PM'})")
-                    )
-                )
+                _hour_label("start", tz.uid, tz.preferred_start)
+            ),
+            air.Label(
+                "Preferred End Time",
+                air.Input(
+                    type="number",
+                    name="end",
+                    min="0",
+                    max="23",
+                    value=str(tz.preferred_end),
+                    **{
+                        "hx-post": f"/update-hours/{tz.uid}",
+                        "hx-trigger": "change",
+                        "hx-swap": "none",
+                        "hx-include": "[name='start']"
+                    }
+                ),
+                _hour_label("end", tz.uid, tz.preferred_end)
             )
+        ),
+        **card_attrs
+    )
+
+
+def render_timezone_list():
+    """Render the full list of timezone cards for the list fragment."""
+    timezones = get_session_timezones()
+
+    if not timezones:
+        # Empty body keeps #timezone-list truly empty so the CSS
+        # :empty placeholder still shows
+        return air.Raw("")
+
+    # Cards go unwrapped: the load fragment then builds the same DOM
+    # under #timezone-list as the out-of-band appends on add
+    now_utc = datetime.now(_zi("UTC"))
+    return air.Raw(
+        "".join(
+            render_timezone_card(tz, now_utc=now_utc).render() for tz in timezones
         )
-    
-    return air.Div(*cards)
+    )
 
 
-@app.get("/grid")
 async def grid_view():
     """Show 24-hour grid with color-coded meeting time viability."""
     timezones = get_session_timezones()
@@ -418,87 +423,64 @@ async def grid_view():
             {"style": "text-align: center; padding: 2rem; color: var(--pico-muted-color);"}
         )
     
-    # Generate 24 hour slots starting from current UTC time's date
+    # Score the 24 hourly slots of the current UTC date in one pass
     base_time = datetime.now(ZoneInfo("UTC"))
-    slots = generate_24hour_slots(base_time)
-    
+    hours = generate_24hour_indices()
+
     # Build timezone config for viability calculation
     tz_config = [{
-        "id": tz["id"],
-        "preferred_start": tz["preferred_start"],
-        "preferred_end": tz["preferred_end"]
+        "id": tz.id,
+        "preferred_start": tz.preferred_start,
+        "preferred_end": tz.preferred_end
     } for tz in timezones]
-    
-    # Create time slot elements
-    time_slot_elements = []
-    for slot in slots:
-        score, color_class = calculate_viability_score(slot, tz_config)
-        
-        # Format the hour
-        hour_24 = slot.hour
-        hour_12 = hour_24 % 12 or 12
-        am_pm = "AM" if hour_24 < 12 else "PM"
-        time_str = f"{hour_12}{am_pm}"
-        
-        # Calculate percentage for display
+
+    scores = calculate_viability_scores_batch(hours, tz_config, base_time)
+
+    return air.Raw(render_grid_html(scores))
+
+
+# Static legend and detail-area markup around the 24 time slots
+_GRID_PREFIX = (
+    '<div>'
+    '<div class="grid-legend">'
+    '<div class="legend-item"><div class="legend-color green"></div>'
+    '<span>All timezones in preferred hours</span></div>'
+    '<div class="legend-item"><div class="legend-color yellow"></div>'
+    '<span>50%+ timezones in preferred hours</span></div>'
+    '<div class="legend-item"><div class="legend-color red"></div>'
+    '<span>Less than 50% in preferred hours</span></div>'
+    '</div>'
+    '<div class="grid-container"><div class="time-grid">'
+)
+
+_GRID_SUFFIX = (
+    '</div></div>'
+    '<div id="time-detail">'
+    '<p style="text-align: center; color: var(--pico-muted-color); font-style: italic;">'
+    'Click on any time slot to see details for all timezones.</p>'
+    '</div>'
+    '</div>'
+)
+
+
+def render_grid_html(scores):
+    """Render the 24-slot grid as one HTML string, skipping the component tree."""
+    parts = [_GRID_PREFIX]
+    for hour, (score, color_class) in enumerate(scores):
         percentage = int(score * 100)
-        
-        time_slot_elements.append(
-            air.Div(
-                {
-                    "class": f"time-slot {color_class}",
-                    "hx-get": f"/grid-detail?hour={hour_24}",
-                    "hx-target": "#time-detail",
-                    "hx-swap": "innerHTML",
-                    "title": f"{percentage}% of timezones in preferred hours"
-                },
-                air.Div({"class": "time-slot-time"}, time_str),
-                air.Div({"class": "time-slot-score"}, f"{percentage}%")
-            )
-        )
-    
-    return air.Div(
-        # Legend
-        air.Div(
-            {"class": "grid-legend"},
-            air.Div(
-                {"class": "legend-item"},
-                air.Div({"class": "legend-color green"}),
-                air.Span("All timezones in preferred hours")
-            ),
-            air.Div(
-                {"class": "legend-item"},
-                air.Div({"class": "legend-color yellow"}),
-                air.Span("50%+ timezones in preferred hours")
-            ),
-            air.Div(
-                {"class": "legend-item"},
-                air.Div({"class": "legend-color red"}),
-                air.Span("Less than 50% in preferred hours")
-            )
-        ),
-        
-        # Grid
-        air.Div(
-            {"class": "grid-container"},
-            air.Div(
-                {"class": "time-grid"},
-                *time_slot_elements
-            )
-        ),
-        
-        # Detail area
-        air.Div(
-            {"id": "time-detail"},
-            air.P(
-                "Click on any time slot to see details for all timezones.",
-                {"style": "text-align: center; color: var(--pico-muted-color); font-style: italic;"}
-            )
+        parts.append(
+            f'<div class="time-slot {color_class}"'
+            f' hx-get="/grid-detail?hour={hour}"'
+            f' hx-target="#time-detail" hx-swap="innerHTML"'
+            f' title="{percentage}% of timezones in preferred hours">'
+            f'<div class="time-slot-time">{_HOUR12_LABEL[hour]}</div>'
+            f'<div class="time-slot-score">{percentage}%</div>'
+            f'</div>'
         )
-    )
+    parts.append(_GRID_SUFFIX)
+    return "".join(parts)
 
 
-@app.get("/grid-detail")
 async def grid_detail(hour: int = 0):
     """Show detailed time breakdown for a specific hour."""
     timezones = get_session_timezones()
@@ -507,22 +489,23 @@ async def grid_detail(hour: int = 0):
         return air.Div("No timezones selected.")
     
     # Create a datetime for the selected hour
-    base_time = datetime.now(ZoneInfo("UTC")).replace(hour=hour, minute=0, second=0, microsecond=0)
+    base_time = datetime.now(_zi("UTC")).replace(hour=hour, minute=0, second=0, microsecond=0)
     
     # Format the base time for display
-    hour_12 = hour % 12 or 12
-    am_pm = "AM" if hour < 12 else "PM"
-    time_header = f"{hour_12}:00 {am_pm} UTC"
+    time_header = f"{_HOUR12_COLON[hour]} UTC"
     
     # Create rows for each timezone
     rows = []
     for tz in timezones:
-        local_time = base_time.astimezone(ZoneInfo(tz["id"]))
+        # Shift the UTC base by the zone's cached whole-hour offset; the
+        # detail rows only display the hour and date, so sub-hour offset
+        # minutes cannot change either
+        local_time = base_time + timedelta(hours=cached_offset_hours(tz.id, base_time))
         local_hour = local_time.hour
         
         # Check if in preferred hours
-        preferred_start = tz["preferred_start"]
-        preferred_end = tz["preferred_end"]
+        preferred_start = tz.preferred_start
+        preferred_end = tz.preferred_end
         
         if preferred_end < preferred_start:
             # Wraps around midnight
@@ -531,9 +514,7 @@ async def grid_detail(hour: int = 0):
             in_hours = preferred_start <= local_hour < preferred_end
         
         # Format local time
-        local_hour_12 = local_hour % 12 or 12
-        local_am_pm = "AM" if local_hour < 12 else "PM"
-        local_time_str = f"{local_hour_12}:00 {local_am_pm}"
+        local_time_str = _HOUR12_COLON[local_hour]
         local_date_str = local_time.strftime("%a, %b %d")
         
         status_text = "✓ In preferred hours" if in_hours else "✗ Outside preferred hours"
@@ -543,7 +524,7 @@ async def grid_detail(hour: int = 0):
             air.Div(
                 {"class": f"timezone-time-row {row_class}"},
                 air.Div(
-                    air.Strong(tz["name"]),
+                    air.Strong(tz.name),
                     air.Br(),
                     air.Small(local_date_str)
                 ),
@@ -575,7 +556,6 @@ async def grid_detail(hour: int = 0):
     )
 
 
-@app.get("/grid-detail-close")
 async def grid_detail_close():
     """Close the detail view."""
     return air.P(
@@ -584,10 +564,48 @@ async def grid_detail_close():
     )
 
 
-@app.get("/converter")
 async def converter_view():
     """Placeholder for converter view."""
     return air.Div(
         air.P("🚧 Converter view coming in Step 4!"),
         air.P("This will let you enter a specific time and see conversions across all timezones.")
     )
+
+
+def create_app() -> air.Air:
+    """Build the application: framework instance, static mount, routes."""
+    app = air.Air()
+
+    app.mount(
+        "/static",
+        _ImmutableStaticFiles(directory=Path(__file__).parent / "static"),
+        name="static",
+    )
+
+    app.get("/")(index)
+    app.get("/timezone-list")(timezone_list)
+    app.post("/add-timezone")(add_timezone)
+    app.delete("/remove-timezone/{uid}")(remove_timezone)
+    app.post("/update-hours/{uid}")(update_hours)
+    app.get("/grid")(grid_view)
+    app.get("/grid-detail")(grid_detail)
+    app.get("/grid-detail-close")(grid_detail_close)
+    app.get("/converter")(converter_view)
+
+    return app
+
+
+def __getattr__(name):
+    # Build the ASGI app lazily so importing this module (e.g. for tests)
+    # does no framework work; `uvicorn main:app` still resolves.
+    if name == "app":
+        global app
+        app = create_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(create_app())
@@ -0,0 +1,23 @@
+// Auto-refresh view when timezones change
+document.addEventListener('DOMContentLoaded', function() {
+    let currentView = null;
+
+    // Track which view is active
+    document.addEventListener('htmx:afterRequest', function(evt) {
+        if (evt.detail.pathInfo.requestPath === '/grid') {
+            currentView = 'grid';
+        } else if (evt.detail.pathInfo.requestPath === '/converter') {
+            currentView = 'converter';
+        }
+
+        // Refresh view after timezone changes
+        const refreshPaths = ['/add-timezone', '/remove-timezone', '/update-hours'];
+        if (refreshPaths.some(path => evt.detail.pathInfo.requestPath.includes(path))) {
+            if (currentView === 'grid') {
+                htmx.ajax('GET', '/grid', {target: '#view-content', swap: 'innerHTML'});
+            } else if (currentView === 'converter') {
+                htmx.ajax('GET', '/converter', {target: '#view-content', swap: 'innerHTML'});
+            }
+        }
+    });
+});
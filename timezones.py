@@ -3,6 +3,11 @@ from datetime import datetime, time
 from zoneinfo import ZoneInfo, available_timezones
 from typing import List, Dict, Tuple
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is an optional accelerator
+    np = None
+
 
 # Common timezones with their display names
 COMMON_TIMEZONES = [
@@ -57,6 +62,54 @@ COMMON_TIMEZONES = [
     ("Pacific/Fiji", "Fiji (FJT)"),
 ]
 
+# O(1) display-name lookup by timezone ID
+COMMON_TIMEZONES_MAP = dict(COMMON_TIMEZONES)
+
+
+# Memoized ZoneInfo instances keyed by timezone ID, so hot paths skip
+# the constructor's cache lookup entirely
+_ZI_CACHE: Dict[str, ZoneInfo] = {}
+
+
+def _zi(tz_id: str) -> ZoneInfo:
+    """Get a cached ZoneInfo instance for a timezone ID."""
+    zi = _ZI_CACHE.get(tz_id)
+    if zi is None:
+        zi = _ZI_CACHE[tz_id] = ZoneInfo(tz_id)
+    return zi
+
+
+# Whole-hour UTC offsets keyed by (tz_id, utc_hour), flushed when the UTC
+# date rolls over; under steady load repeat requests in the same hour pay
+# only a dict lookup instead of a tzdata traversal
+_OFFSET_CACHE: Dict[Tuple[str, int], int] = {}
+_OFFSET_CACHE_DAY: List = [None]
+
+
+def cached_offset_hours(tz_id: str, dt: datetime) -> int:
+    """
+    Get a timezone's UTC offset in whole hours at dt, cached per UTC hour.
+
+    Offsets only change at DST transitions, so the (tz_id, hour) result
+    is stable within a UTC date; the cache is cleared when the date
+    changes, bounding it to 24 entries per zone.
+    """
+    day = dt.toordinal()
+    if _OFFSET_CACHE_DAY[0] != day:
+        _OFFSET_CACHE.clear()
+        _OFFSET_CACHE_DAY[0] = day
+
+    key = (tz_id, dt.hour)
+    offset = _OFFSET_CACHE.get(key)
+    if offset is None:
+        # astimezone resolves the offset at dt's actual instant; calling
+        # ZoneInfo.utcoffset(dt) directly would reinterpret dt's naive
+        # fields as the zone's local wall time
+        offset = _OFFSET_CACHE[key] = int(
+            dt.astimezone(_zi(tz_id)).utcoffset().total_seconds() // 3600
+        )
+    return offset
+
 
 def get_common_timezones() -> List[Tuple[str, str]]:
     """Return list of common timezones as (id, display_name) tuples."""
@@ -65,7 +118,7 @@ def get_common_timezones() -> List[Tuple[str, str]]:
 
 def get_current_time_in_timezone(tz_id: str) -> datetime:
     """Get current time in specified timezone."""
-    return datetime.now(ZoneInfo(tz_id))
+    return datetime.now(_zi(tz_id))
 
 
 def convert_time_to_timezones(
@@ -86,11 +139,11 @@ def convert_time_to_timezones(
     """
     # Ensure source datetime is aware
     if source_dt.tzinfo is None:
-        source_dt = source_dt.replace(tzinfo=ZoneInfo(source_tz))
-    
+        source_dt = source_dt.replace(tzinfo=_zi(source_tz))
+
     result = {}
     for tz_id in target_timezones:
-        result[tz_id] = source_dt.astimezone(ZoneInfo(tz_id))
+        result[tz_id] = source_dt.astimezone(_zi(tz_id))
     
     return result
 
@@ -111,8 +164,11 @@ def is_time_in_preferred_hours(
     Returns:
         True if time falls within preferred hours
     """
-    hour = dt.hour
-    
+    return _is_hour_in_preferred(dt.hour, preferred_start, preferred_end)
+
+
+def _is_hour_in_preferred(hour: int, preferred_start: int, preferred_end: int) -> bool:
+    """Check if an hour (0-23) falls within preferred hours."""
     # Handle case where end < start (e.g., 22:00 to 06:00)
     if preferred_end < preferred_start:
         return hour >= preferred_start or hour < preferred_end
@@ -120,6 +176,41 @@ def is_time_in_preferred_hours(
         return preferred_start <= hour < preferred_end
 
 
+def make_hour_predicate(preferred_start: int, preferred_end: int):
+    """
+    Build a specialized hour predicate for a preferred-hours window.
+
+    Resolves the does-it-wrap-midnight branch once, so callers testing
+    many hours against the same window pay a single comparison per call.
+    """
+    if preferred_end >= preferred_start:
+        return lambda hour: preferred_start <= hour < preferred_end
+    return lambda hour: hour >= preferred_start or hour < preferred_end
+
+
+def _hours_mask(preferred_start: int, preferred_end: int) -> int:
+    """
+    Build a 24-bit mask where bit h is set iff hour h is preferred.
+
+    Membership then becomes `(mask >> hour) & 1` — one shift and one AND,
+    with no branch on whether the window wraps midnight.
+    """
+    if preferred_end >= preferred_start:
+        return ((1 << preferred_end) - 1) ^ ((1 << preferred_start) - 1)
+    # Wraps around midnight: hours [start, 24) plus [0, end)
+    return (0xFFFFFF ^ ((1 << preferred_start) - 1)) | ((1 << preferred_end) - 1)
+
+
+def _score_color(score: float) -> str:
+    """Map a viability score to its display color class."""
+    if score == 1.0:
+        return "green"
+    elif score >= 0.5:
+        return "yellow"
+    else:
+        return "red"
+
+
 def calculate_viability_score(
     dt: datetime,
     timezones_config: List[Dict[str, any]]
@@ -146,22 +237,174 @@ def calculate_viability_score(
         preferred_end = tz_config.get("preferred_end", 17)
         
         # Convert time to this timezone
-        local_dt = dt.astimezone(ZoneInfo(tz_id))
+        local_dt = dt.astimezone(_zi(tz_id))
         
         if is_time_in_preferred_hours(local_dt, preferred_start, preferred_end):
             in_preferred_count += 1
     
     score = in_preferred_count / total_count
-    
-    # Determine color class based on score
-    if score == 1.0:
-        color_class = "green"
-    elif score >= 0.5:
-        color_class = "yellow"
-    else:
-        color_class = "red"
-    
-    return (score, color_class)
+
+    return (score, _score_color(score))
+
+
+def calculate_viability_class(
+    dt: datetime,
+    timezones_config: List[Dict[str, any]]
+) -> str:
+    """
+    Determine just the color class for a given time, exiting early.
+
+    Unlike calculate_viability_score this does not promise an exact
+    score, so it can stop as soon as the class is decided: "red" once
+    the remaining zones cannot lift the score to 0.5, "yellow" once the
+    score is guaranteed at least 0.5 but a miss has ruled out "green".
+
+    Args:
+        dt: Base datetime (should be timezone-aware)
+        timezones_config: List of dicts with keys: id, preferred_start, preferred_end
+
+    Returns:
+        Color class: "green", "yellow" or "red"
+    """
+    if not timezones_config:
+        return "red"
+
+    total_count = len(timezones_config)
+    threshold = total_count * 0.5
+    in_preferred_count = 0
+    missed = False
+
+    for checked, tz_config in enumerate(timezones_config, start=1):
+        tz_id = tz_config["id"]
+        preferred_start = tz_config.get("preferred_start", 9)
+        preferred_end = tz_config.get("preferred_end", 17)
+
+        local_dt = dt.astimezone(_zi(tz_id))
+        if is_time_in_preferred_hours(local_dt, preferred_start, preferred_end):
+            in_preferred_count += 1
+        else:
+            missed = True
+
+        remaining = total_count - checked
+        if in_preferred_count + remaining < threshold:
+            return "red"
+        if missed and in_preferred_count >= threshold:
+            return "yellow"
+
+    return _score_color(in_preferred_count / total_count)
+
+
+def calculate_viability_scores_batch(
+    hours: List[int],
+    timezones_config: List[Dict[str, any]],
+    base_date: datetime = None
+) -> List[Tuple[float, str]]:
+    """
+    Calculate viability scores for a batch of UTC hours at once.
+
+    Computes each timezone's UTC offset once and derives local hours by
+    integer arithmetic, instead of a full astimezone conversion per
+    (hour, timezone) pair. Falls back to per-hour conversion for any
+    timezone whose offset changes within the batch (a DST transition).
+
+    Args:
+        hours: Sequence of UTC hours (0-23), e.g. range(24)
+        timezones_config: List of dicts with keys: id, preferred_start, preferred_end
+        base_date: Date anchoring the offset lookups (defaults to current UTC date)
+
+    Returns:
+        List of (score 0.0-1.0, color_class) tuples, one per hour
+    """
+    if not timezones_config:
+        return [(0.0, "red")] * len(hours)
+
+    if base_date is None:
+        base_date = datetime.now(_zi("UTC"))
+    first_dt = base_date.replace(hour=hours[0], minute=0, second=0, microsecond=0)
+    last_dt = first_dt.replace(hour=hours[-1])
+
+    # Vectorized path: needs NumPy, enough timezones to amortize the array
+    # setup, and a stable offset per zone across the batch
+    if np is not None and len(timezones_config) >= _VEC_MIN_TIMEZONES:
+        offset_hours = []
+        for tz_config in timezones_config:
+            tz_id = tz_config["id"]
+            offset = cached_offset_hours(tz_id, first_dt)
+            if cached_offset_hours(tz_id, last_dt) != offset:
+                break
+            offset_hours.append(offset)
+        else:
+            return _viability_scores_vec(hours, timezones_config, offset_hours)
+
+    total_count = len(timezones_config)
+    in_preferred_counts = [0] * len(hours)
+
+    for tz_config in timezones_config:
+        tz_id = tz_config["id"]
+        preferred_start = tz_config.get("preferred_start", 9)
+        preferred_end = tz_config.get("preferred_end", 17)
+
+        first_offset = cached_offset_hours(tz_id, first_dt)
+        if cached_offset_hours(tz_id, last_dt) == first_offset:
+            # Offset is stable across the batch: rotate the zone's
+            # preferred-hours mask into the UTC frame, then each hour is
+            # a single shift-and-AND with no branches
+            offset_hours = first_offset % 24
+            local_mask = _hours_mask(preferred_start, preferred_end)
+            utc_mask = (
+                (local_mask >> offset_hours) | (local_mask << (24 - offset_hours))
+            ) & 0xFFFFFF
+            for i, hour in enumerate(hours):
+                in_preferred_counts[i] += (utc_mask >> hour) & 1
+        else:
+            # DST transition inside the batch: convert each hour
+            in_preferred = make_hour_predicate(preferred_start, preferred_end)
+            for i, hour in enumerate(hours):
+                local_dt = first_dt.replace(hour=hour).astimezone(_zi(tz_id))
+                if in_preferred(local_dt.hour):
+                    in_preferred_counts[i] += 1
+
+    return [
+        (count / total_count, _score_color(count / total_count))
+        for count in in_preferred_counts
+    ]
+
+
+# Below this many timezones the NumPy setup cost outweighs the win
+_VEC_MIN_TIMEZONES = 4
+
+
+def _viability_scores_vec(
+    hours: List[int],
+    timezones_config: List[Dict[str, any]],
+    offset_hours: List[int]
+) -> List[Tuple[float, str]]:
+    """
+    NumPy-vectorized scoring used by calculate_viability_scores_batch.
+
+    Builds an N x len(hours) boolean table of "zone in preferred hours"
+    with one broadcasted comparison, then reduces along the zone axis.
+    Callers must pass one stable UTC offset (in hours) per timezone.
+    """
+    offsets = np.array(offset_hours, dtype=np.int8)[:, None]
+    starts = np.array(
+        [c.get("preferred_start", 9) for c in timezones_config], dtype=np.int8
+    )[:, None]
+    ends = np.array(
+        [c.get("preferred_end", 17) for c in timezones_config], dtype=np.int8
+    )[:, None]
+
+    utc_hours = np.array(hours, dtype=np.int8)
+    local = (utc_hours[None, :] + offsets) % 24
+
+    in_preferred = np.where(
+        ends >= starts,
+        (local >= starts) & (local < ends),
+        (local >= starts) | (local < ends),
+    )
+    scores = in_preferred.mean(axis=0)
+
+    return [(score, _score_color(score)) for score in scores.tolist()]
 
 
 def generate_24hour_slots(base_date: datetime = None) -> List[datetime]:
@@ -175,18 +418,20 @@ def generate_24hour_slots(base_date: datetime = None) -> List[datetime]:
         List of 24 datetime objects, one for each hour
     """
     if base_date is None:
-        base_date = datetime.now(ZoneInfo("UTC"))
+        base_date = datetime.now(_zi("UTC"))
     
     # Start at midnight of the base date
     start = base_date.replace(hour=0, minute=0, second=0, microsecond=0)
-    
+
     return [start.replace(hour=h) for h in range(24)]
 
 
+def generate_24hour_indices() -> range:
+    """Generate the 24 hourly slot indices (0-23) without datetime objects."""
+    return range(24)
+
+
 def format_timezone_display(tz_id: str) -> str:
     """Get display name for a timezone ID."""
-    for tid, name in COMMON_TIMEZONES:
-        if tid == tz_id:
-            return name
-    return tz_id
+    return COMMON_TIMEZONES_MAP.get(tz_id, tz_id)
 